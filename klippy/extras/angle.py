@@ -495,12 +495,12 @@ class Angle:
             msg_mclock = start_clock + samp_count*sample_ticks
             d = bytearray(params['data'])
             for i in range(len(d) // BYTES_PER_SAMPLE):
-                d_ta = d[i*BYTES_PER_SAMPLE:(i+1)*BYTES_PER_SAMPLE]
-                tcode = d_ta[0]
+                pos = i * BYTES_PER_SAMPLE
+                tcode = d[pos]
                 if tcode == TCODE_ERROR:
                     error_count += 1
                     continue
-                raw_angle = d_ta[1] | (d_ta[2] << 8)
+                raw_angle = d[pos + 1] | (d[pos + 2] << 8)
                 angle_diff = (raw_angle - last_angle) & 0xffff
                 angle_diff -= (angle_diff & 0x8000) << 1
                 last_angle += angle_diff
@@ -210,6 +210,13 @@ class FixedFreqReader:
         self.unpack_from = unpack.unpack_from
         self.bytes_per_sample = unpack.size
         self.samples_per_block = MAX_BULK_MSG_SIZE // self.bytes_per_sample
+        # Samples with a single value can be unpacked a message at a time
+        self.bulk_fmt = None
+        self.bulk_unpacks = {}
+        fmt_order, fmt_code = unpack_fmt[:-1], unpack_fmt[-1:]
+        if fmt_order in ('', '@', '=', '<', '>', '!'):
+            self.bulk_fmt = fmt_order + '%d' + fmt_code
+            self._build_bulk_unpack(self.samples_per_block)
         self.last_sequence = self.max_query_duration = 0
         self.last_overflows = 0
         self.bulk_queue = self.oid = self.query_status_cmd = None
@@ -222,6 +229,10 @@ class FixedFreqReader:
             oid=oid, cq=cq)
         # Read sensor_bulk_data messages and store in a queue
         self.bulk_queue = BulkDataQueue(self.mcu, oid=oid)
+    def _build_bulk_unpack(self, num_samples):
+        unpack = struct.Struct(self.bulk_fmt % (num_samples,)).unpack_from
+        self.bulk_unpacks[num_samples] = unpack
+        return unpack
     def get_last_overflows(self):
         return self.last_overflows
     def _clear_duration_filter(self):
@@ -278,6 +289,8 @@ class FixedFreqReader:
         unpack_from = self.unpack_from
         bytes_per_sample = self.bytes_per_sample
         samples_per_block = self.samples_per_block
+        bulk_fmt = self.bulk_fmt
+        bulk_unpacks = self.bulk_unpacks
         # Process every message in raw_samples
         count = seq = 0
         samples = [None] * (len(raw_samples) * samples_per_block)
@@ -287,7 +300,20 @@ class FixedFreqReader:
             seq = last_sequence + seq_diff
             msg_cdiff = seq * samples_per_block - chip_base
             data = params['data']
-            for i in range(len(data) // bytes_per_sample):
+            num_samples = len(data) // bytes_per_sample
+            if bulk_fmt is not None:
+                # Unpack all values of the message with a single call
+                bulk_unpack = bulk_unpacks.get(num_samples)
+                if bulk_unpack is None:
+                    bulk_unpack = self._build_bulk_unpack(num_samples)
+                udata = bulk_unpack(data)
+                ptimes = [time_base + (msg_cdiff + i) * inv_freq
+                          for i in range(num_samples)]
+                samples[count:count+num_samples] = zip(ptimes, udata)
+                count += num_samples
+                i = num_samples - 1
+                continue
+            for i in range(num_samples):
                 ptime = time_base + (msg_cdiff + i) * inv_freq
                 udata = unpack_from(data, i * bytes_per_sample)
                 samples[count] = (ptime,) + udata
@@ -112,7 +112,7 @@ class MCU_trsync:
         self._trdispatch = trdispatch
         self._reactor = mcu.get_printer().get_reactor()
         self._steppers = []
-        self._trdispatch_mcu = None
+        self._trdispatch_mcu = self._ffi_lib = None
         self._oid = mcu.create_oid()
         self._cmd_queue = mcu.alloc_command_queue()
         self._trsync_start_cmd = self._trsync_set_timeout_cmd = None
@@ -164,11 +164,11 @@ class MCU_trsync:
         state_cmd = mcu.lookup_command(
             "trsync_state oid=%c can_trigger=%c trigger_reason=%c clock=%u")
         state_tag = state_cmd.get_command_tag()
-        ffi_main, ffi_lib = chelper.get_ffi()
-        self._trdispatch_mcu = ffi_main.gc(ffi_lib.trdispatch_mcu_alloc(
+        ffi_main, self._ffi_lib = chelper.get_ffi()
+        self._trdispatch_mcu = ffi_main.gc(self._ffi_lib.trdispatch_mcu_alloc(
             self._trdispatch, mcu._serial.get_serialqueue(), # XXX
             self._cmd_queue, self._oid, set_timeout_tag, trigger_tag,
-            state_tag), ffi_lib.free)
+            state_tag), self._ffi_lib.free)
     def _shutdown(self):
         tc = self._trigger_completion
         if tc is not None:
@@ -198,9 +198,9 @@ class MCU_trsync:
         report_ticks = self._mcu.seconds_to_clock(expire_timeout * .3)
         report_clock = clock + int(report_ticks * report_offset + .5)
         min_extend_ticks = int(report_ticks * .8 + .5)
-        ffi_main, ffi_lib = chelper.get_ffi()
-        ffi_lib.trdispatch_mcu_setup(self._trdispatch_mcu, clock, expire_clock,
-                                     expire_ticks, min_extend_ticks)
+        self._ffi_lib.trdispatch_mcu_setup(self._trdispatch_mcu, clock,
+                                           expire_clock, expire_ticks,
+                                           min_extend_ticks)
         self._mcu.register_response(self._handle_trsync_state,
                                     "trsync_state", self._oid)
         self._trsync_start_cmd.send([self._oid, report_clock, report_ticks,
@@ -230,8 +230,9 @@ class TriggerDispatch:
     def __init__(self, mcu):
         self._mcu = mcu
         self._trigger_completion = None
-        ffi_main, ffi_lib = chelper.get_ffi()
-        self._trdispatch = ffi_main.gc(ffi_lib.trdispatch_alloc(), ffi_lib.free)
+        ffi_main, self._ffi_lib = chelper.get_ffi()
+        self._trdispatch = ffi_main.gc(self._ffi_lib.trdispatch_alloc(),
+                                       self._ffi_lib.free)
         self._trsyncs = [MCU_trsync(mcu, self._trdispatch)]
     def get_oid(self):
         return self._trsyncs[0].get_oid()
@@ -266,8 +267,8 @@ class TriggerDispatch:
             trsync.start(print_time, report_offset,
                          self._trigger_completion, expire_timeout)
         etrsync = self._trsyncs[0]
-        ffi_main, ffi_lib = chelper.get_ffi()
-        ffi_lib.trdispatch_start(self._trdispatch, etrsync.REASON_HOST_REQUEST)
+        self._ffi_lib.trdispatch_start(self._trdispatch,
+                                       etrsync.REASON_HOST_REQUEST)
         return self._trigger_completion
     def wait_end(self, end_time):
         etrsync = self._trsyncs[0]
@@ -276,8 +277,7 @@ class TriggerDispatch:
             self._trigger_completion.complete(True)
         self._trigger_completion.wait()
     def stop(self):
-        ffi_main, ffi_lib = chelper.get_ffi()
-        ffi_lib.trdispatch_stop(self._trdispatch)
+        self._ffi_lib.trdispatch_stop(self._trdispatch)
         res = [trsync.stop() for trsync in self._trsyncs]
         err_res = [r for r in res if r >= MCU_trsync.REASON_COMMS_TIMEOUT]
         if err_res: